@@ -1,8 +1,10 @@
-from pydantic import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     # Providers
     SOLANA_RPC_URL: str
+    SOLANA_WS_URL: str | None = None  # defaults to SOLANA_RPC_URL with ws(s)://
+    SOLANA_RPC_URLS: list[str] = []  # extra endpoints sendTransaction is broadcast to (JSON list)
     JUPITER_BASE: str = "https://quote-api.jup.ag"
     RUGCHECK_API_BASE: str = "https://api.rugcheck.xyz"
     RUGCHECK_API_KEY: str | None = None
@@ -11,6 +13,8 @@ class Settings(BaseSettings):
 
     # Optional PumpPortal base HTTP endpoint
     PUMPPORTAL_BASE: str | None = None
+    # Optional PumpPortal new-token stream (e.g. wss://pumpportal.fun/api/data); replaces polling when set
+    PUMPPORTAL_WS_URL: str | None = None
 
     # Wallet
     WALLET_PUBLIC_KEY: str
@@ -23,6 +27,10 @@ class Settings(BaseSettings):
     MAX_POSITION_USD: float = 10.0
     SLIPPAGE_BPS: int = 50
 
+    # Provider response caches (seconds)
+    RUGCHECK_CACHE_TTL: float = 120.0
+    QUOTE_CACHE_TTL: float = 3.0
+
     # Strategy
     TP_PCT: float = 40.0
     SL_PCT: float = 15.0
@@ -31,8 +39,10 @@ class Settings(BaseSettings):
 
     # Misc
     LOG_LEVEL: str = "INFO"
+    MAX_CONCURRENCY: int = 16  # candidates processed in parallel
+    SEEN_TTL: float = 300.0  # seconds before an already-processed mint is considered again
 
-    class Config:
-        env_file = ".env"
+    # .env is shared with the other apps, so ignore keys we don't define
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 settings = Settings()
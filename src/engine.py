@@ -1,23 +1,45 @@
-import logging
+import asyncio, logging, time
+from collections import OrderedDict
 from src.config import settings
 from src.providers import rugcheck
 from src.risk import TokenInfo, hard_filters_pass
 from src.executor import simulate_buy_sell_usd, execute_trade
 from src.strategy.basic import decide
 from src.providers.bitquery import fetch_candidates as fetch_from_bq
-from src.providers.pumpportal import fetch_candidates as fetch_from_pp
+from src.providers.pumpportal import fetch_candidates as fetch_from_pp, QUEUE as pp_queue
 
 log = logging.getLogger(__name__)
 
-async def process_candidates(candidates: list, *, paper: bool = True):
-    if not candidates:
-        log.info("No candidates.")
-        return
-
-    mints = [c.mint for c in candidates]
-    rc_bulk = await rugcheck.bulk_summary(mints)
+# mint -> monotonic time we last finished processing it; oldest evicted past SEEN_MAX
+SEEN: "OrderedDict[str, float]" = OrderedDict()
+SEEN_MAX = 4096
+# mints currently being handled, so overlapping batches don't double up
+_IN_FLIGHT: set[str] = set()
+# shared across batches, which overlap in streaming mode
+_SEM = asyncio.Semaphore(settings.MAX_CONCURRENCY)
 
+def _fresh(candidates: list) -> list:
+    """Drop duplicate, in-flight and recently processed (SEEN_TTL) mints; claims the rest as in flight."""
+    now = time.monotonic()
+    unique = {}
     for c in candidates:
+        if c.mint in unique or c.mint in _IN_FLIGHT:
+            continue
+        seen_at = SEEN.get(c.mint)
+        if seen_at is not None and now - seen_at < settings.SEEN_TTL:
+            continue
+        unique[c.mint] = c
+    _IN_FLIGHT.update(unique)
+    return list(unique.values())
+
+def _mark_seen(mint: str):
+    SEEN[mint] = time.monotonic()
+    SEEN.move_to_end(mint)
+    while len(SEEN) > SEEN_MAX:
+        SEEN.popitem(last=False)
+
+async def _handle(c, rc_bulk: dict, sem: asyncio.Semaphore, *, paper: bool):
+    async with sem:
         rc = rc_bulk.get(c.mint, {"risk_level": "high"})
         # TODO: replace with real chain/indexer checks
         info = TokenInfo(
@@ -30,22 +52,67 @@ async def process_candidates(candidates: list, *, paper: bool = True):
         )
         if not hard_filters_pass(info, rc, max_top5=settings.MAX_TOP5_PCT, min_liq=settings.MIN_LIQ_SOL):
             log.info("SKIP %s — failed hard filters: %s", c.mint, rc)
-            continue
+            return
 
-        sell_sim_ok = await simulate_buy_sell_usd(c.mint, settings.TEST_BUY_USD)
+        # decide() only looks at the sell sim for graduated tokens, so paper mode can skip the
+        # Jupiter round-trips otherwise; a live buy always needs it (sends skip preflight)
+        needs_sim = info.graduated or not paper
+        sell_sim_ok = await simulate_buy_sell_usd(c.mint, settings.TEST_BUY_USD) if needs_sim else False
         decision = decide(settings.TEST_BUY_USD, settings.MAX_POSITION_USD, info.graduated, sell_sim_ok)
 
         if not decision.should_test_buy:
             log.info("SKIP %s — decision denied", c.mint)
-            continue
+            return
 
         if paper:
             log.info("PAPER BUY %s — target $%.2f", c.mint, decision.target_usd)
+        elif not sell_sim_ok:
+            log.info("SKIP %s — buy/sell simulation failed", c.mint)
         else:
             tx = await execute_trade(c.mint, decision.target_usd)
             log.info("LIVE BUY %s — tx: %s", c.mint, tx)
 
+async def process_candidates(candidates: list, *, paper: bool = True):
+    if not candidates:
+        log.info("No candidates.")
+        return
+
+    candidates = _fresh(candidates)
+    if not candidates:
+        log.info("No new candidates.")
+        return
+
+    try:
+        mints = [c.mint for c in candidates]
+        # goes through the shared batcher so overlapping cycles share one POST
+        summaries = await asyncio.gather(*[rugcheck.batcher.get(m) for m in mints])
+        rc_bulk = {m: rc for m, rc in zip(mints, summaries) if rc is not None}
+
+        # candidates are independent; fan out, bounded so we don't flood providers
+        results = await asyncio.gather(
+            *[_handle(c, rc_bulk, _SEM, paper=paper) for c in candidates],
+            return_exceptions=True,
+        )
+        # only fully handled mints are skipped next time; failures get retried
+        for c, res in zip(candidates, results):
+            if isinstance(res, Exception):
+                log.error("FAIL %s — %r", c.mint, res)
+            else:
+                _mark_seen(c.mint)
+    finally:
+        _IN_FLIGHT.difference_update(c.mint for c in candidates)
+
 async def collect_candidates():
+    if settings.PUMPPORTAL_WS_URL:
+        # streaming: wait for the next pushed token, then take whatever else is queued
+        cands = [await pp_queue.get()]
+        while True:
+            try:
+                cands.append(pp_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return cands
+
     # Try PumpPortal first, then Bitquery, else stub
     cands = await fetch_from_pp()
     if not cands:
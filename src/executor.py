@@ -1,22 +1,32 @@
 import logging, base64
+import orjson
 from solders.transaction import VersionedTransaction
 from src.config import settings
-from src.providers.jupiter import simulate_buy_sell
-from src.utils.solana import load_keypair, rpc_send_raw_tx
+from src.providers._http import CLIENT, JSON_HEADERS, retry_transient_within
+from src.providers.jupiter import BREAKER as JUPITER_BREAKER, simulate_buy_sell
+from src.utils.solana import get_keypair, rpc_send_raw_tx
+from src.utils.solana_ws import wait_for_signature
 
 log = logging.getLogger(__name__)
 
 LAMPORTS_PER_SOL = 1_000_000_000
+USD_TO_LAMPORTS = LAMPORTS_PER_SOL // 100  # ~0.01 SOL per $1 (rough heuristic)
+MIN_LAMPORTS = LAMPORTS_PER_SOL // 1000    # min 0.001 SOL
+CONFIRM_TIMEOUT = 30.0  # seconds to wait for "confirmed" before reporting SENT
+SWAP_BUILD_TIMEOUT = 5.0  # per /v6/swap attempt
+SWAP_BUILD_DEADLINE = 10.0  # across retries; the quote behind it goes stale
+
+def _lamports(usd: float) -> int:
+    # naive: treat USD as SOL for sizing (you can convert via a price oracle if desired)
+    return max(int(max(1.0, usd) * USD_TO_LAMPORTS), MIN_LAMPORTS)
 
 async def simulate_buy_sell_usd(token_mint: str, usd_amount: float) -> bool:
-    # naive: treat USD as SOL for simulation sizing (you can convert via a price oracle if desired)
-    lamports = int(max(1, usd_amount) * 0.01 * LAMPORTS_PER_SOL)  # ~0.01 SOL per $1 (rough heuristic)
-    lamports = max(lamports, int(0.001 * LAMPORTS_PER_SOL))       # min 0.001 SOL
-    return await simulate_buy_sell(token_mint, lamports, settings.SLIPPAGE_BPS)
+    return await simulate_buy_sell(token_mint, _lamports(usd_amount), settings.SLIPPAGE_BPS)
 
+@JUPITER_BREAKER
+@retry_transient_within(SWAP_BUILD_DEADLINE)
 async def _jup_swap_build(user_pubkey: str, quote_resp: dict) -> str:
     """Call Jupiter /v6/swap to get a base64 tx for SOL->TOKEN. Returns base64 string."""
-    import httpx
     url = f"{settings.JUPITER_BASE}/v6/swap"
     body = {
         "userPublicKey": user_pubkey,
@@ -26,13 +36,12 @@ async def _jup_swap_build(user_pubkey: str, quote_resp: dict) -> str:
         # Optional: prioritization fee (lamports)
         "prioritizationFeeLamports": 0,
     }
-    async with httpx.AsyncClient(timeout=20) as s:
-        r = await s.post(url, json=body)
-        r.raise_for_status()
-        data = r.json()
-        if "swapTransaction" not in data:
-            raise RuntimeError(f"Jupiter swap error: {data}")
-        return data["swapTransaction"]
+    r = await CLIENT.post(url, content=orjson.dumps(body), headers=JSON_HEADERS, timeout=SWAP_BUILD_TIMEOUT)
+    r.raise_for_status()
+    data = orjson.loads(r.content)
+    if "swapTransaction" not in data:
+        raise RuntimeError(f"Jupiter swap error: {data}")
+    return data["swapTransaction"]
 
 async def execute_trade(token_mint: str, usd_amount: float) -> dict:
     """Build, sign, and send a SOL->TOKEN swap via Jupiter v6.
@@ -41,23 +50,34 @@ async def execute_trade(token_mint: str, usd_amount: float) -> dict:
     if not settings.WALLET_PRIVATE_KEY:
         raise RuntimeError("WALLET_PRIVATE_KEY missing for live execution")
 
-    lamports_in = int(max(1, usd_amount) * 0.01 * LAMPORTS_PER_SOL)
-    lamports_in = max(lamports_in, int(0.001 * LAMPORTS_PER_SOL))
+    lamports_in = _lamports(usd_amount)
 
-    from src.providers.jupiter import SOL_MINT, quote
-    q = await quote(SOL_MINT, token_mint, lamports_in, settings.SLIPPAGE_BPS)
+    from src.providers.jupiter import SOL_MINT, quote, invalidate_quotes
+    # fresh quote: a cached one could carry a stale otherAmountThreshold into the swap
+    q = await quote(SOL_MINT, token_mint, lamports_in, settings.SLIPPAGE_BPS, use_cache=False)
     if not q or int(q.get("outAmount", 0)) <= 0:
         raise RuntimeError("Quote failed or zero outAmount")
 
     swap_b64 = await _jup_swap_build(settings.WALLET_PUBLIC_KEY, q)
 
-    kp = load_keypair(settings.WALLET_PRIVATE_KEY)
+    kp = get_keypair()
     tx_bytes = base64.b64decode(swap_b64)
     vtx = VersionedTransaction.from_bytes(tx_bytes)
     vtx.sign([kp])
     raw_b64 = base64.b64encode(bytes(vtx)).decode()
 
     res = await rpc_send_raw_tx(raw_b64)
+    invalidate_quotes(token_mint)
     sig = res.get("result") or res
     log.info("Sent swap tx: %s", sig)
-    return {"signature": sig, "status": "SENT"}
+    if not isinstance(sig, str):
+        return {"signature": sig, "status": "SENT"}
+
+    conf = await wait_for_signature(sig, commitment="confirmed", timeout=CONFIRM_TIMEOUT)
+    if conf is None:
+        log.warning("Swap tx %s not confirmed within %.0fs", sig, CONFIRM_TIMEOUT)
+        return {"signature": sig, "status": "SENT"}
+    if conf.get("err"):
+        log.warning("Swap tx %s failed: %s", sig, conf["err"])
+        return {"signature": sig, "status": "FAILED", "err": conf["err"]}
+    return {"signature": sig, "status": "CONFIRMED"}
@@ -1,16 +1,47 @@
-import asyncio, argparse, logging, os
-from dotenv import load_dotenv
+import asyncio, argparse, logging
 from src.config import settings
 from src.engine import process_candidates, collect_candidates
+from src.providers._http import CLIENT
+from src.providers.pumpportal import stream_candidates
+from src.utils import solana_ws
 
-load_dotenv()
-
-LOG_LEVEL = getattr(logging, os.getenv("LOG_LEVEL", settings.LOG_LEVEL), logging.INFO)
+# settings already reads the environment and .env (pydantic-settings)
+LOG_LEVEL = getattr(logging, settings.LOG_LEVEL, logging.INFO)
 logging.basicConfig(level=LOG_LEVEL, format="[%(levelname)s] %(name)s: %(message)s")
+log = logging.getLogger(__name__)
+
+async def _run_batch(cands: list, paper: bool):
+    # a failing batch (provider outage, open circuit, ...) must not stop the stream
+    try:
+        await process_candidates(cands, paper=paper)
+    except Exception as e:
+        log.exception("Batch of %d candidates failed: %s", len(cands), e)
 
 async def run(paper: bool):
-    cands = await collect_candidates()
-    await process_candidates(cands, paper=paper)
+    async with CLIENT:
+        if not settings.PUMPPORTAL_WS_URL:
+            try:
+                cands = await collect_candidates()
+                await process_candidates(cands, paper=paper)
+            finally:
+                await solana_ws.close()
+            return
+
+        # streaming: run continuously, each batch in its own task so a slow one
+        # (e.g. a live buy waiting on confirmation) doesn't hold up intake
+        stream = asyncio.create_task(stream_candidates())
+        batches: set[asyncio.Task] = set()
+        try:
+            while True:
+                cands = await collect_candidates()
+                task = asyncio.create_task(_run_batch(cands, paper))
+                batches.add(task)
+                task.add_done_callback(batches.discard)
+        finally:
+            stream.cancel()
+            for task in batches:
+                task.cancel()
+            await solana_ws.close()
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
@@ -18,4 +49,9 @@ if __name__ == "__main__":
     ap.add_argument("--live", action="store_true", help="Send real transactions (requires key)")
     args = ap.parse_args()
     paper = True if args.paper or not args.live else False
-    asyncio.run(run(paper=paper))
+    try:
+        import uvloop  # faster event loop; not available on Windows
+    except ImportError:
+        asyncio.run(run(paper=paper))
+    else:
+        uvloop.run(run(paper=paper))
@@ -0,0 +1,115 @@
+"""Shared HTTP client for all outbound provider / RPC calls.
+One long-lived AsyncClient keeps its connection pool warm so we don't pay a
+fresh TCP + TLS handshake on every request. Closed by src.main on shutdown.
+"""
+import asyncio, functools, logging, time
+import httpx
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+log = logging.getLogger(__name__)
+
+# Jupiter and most Solana RPCs speak HTTP/2, so bursts of quote / swap /
+# sendTransaction calls multiplex over a handful of connections.
+CLIENT = httpx.AsyncClient(
+    timeout=httpx.Timeout(10.0),
+    limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0),
+    http2=True,
+)
+
+# bodies are encoded with orjson and sent as raw content, so set the type ourselves
+JSON_HEADERS = {"content-type": "application/json"}
+
+def is_transient(exc: BaseException) -> bool:
+    """Network errors, timeouts, rate limits and 5xx are worth retrying; other 4xx are not."""
+    if isinstance(exc, (httpx.TransportError, TimeoutError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code == 429 or code >= 500
+    return False
+
+def raise_for_transient(r: httpx.Response):
+    if r.status_code == 429 or r.status_code >= 500:
+        r.raise_for_status()
+
+# a few quick attempts; anything longer is the circuit breaker's job
+retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.05, max=1.0),
+    retry=retry_if_exception(is_transient),
+    reraise=True,
+)
+
+def retry_transient_within(deadline: float):
+    """retry_transient with a hard cap of `deadline` seconds across all attempts,
+    for calls where a late success is as bad as a failure (e.g. sending a tx
+    whose blockhash is about to expire). Raises TimeoutError past the deadline.
+    """
+    def decorate(fn):
+        retried = retry_transient(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            async with asyncio.timeout(deadline):
+                return await retried(*args, **kwargs)
+        return wrapper
+    return decorate
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+class CircuitBreaker:
+    """Fails fast for `reset_timeout` seconds after `fail_max` consecutive transient
+    failures. After that a single probe call is let through (half-open) while other
+    callers keep failing fast; the probe's outcome closes or re-opens the circuit.
+    Non-transient errors (4xx, bad payloads) mean the provider answered, so they
+    count as success for availability purposes.
+    Use as a decorator on coroutines or via `await breaker.call(fn, *args)`.
+    """
+
+    def __init__(self, name: str, fail_max: int = 10, reset_timeout: float = 30.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probing = False
+
+    async def call(self, fn, *args, **kwargs):
+        probe = False
+        if self.opened_at is not None:
+            if self._probing or time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"{self.name} circuit open")
+            probe = self._probing = True
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            if is_transient(e):
+                self._on_failure()
+            else:
+                self._on_success()
+            raise
+        else:
+            self._on_success()
+            return result
+        finally:
+            if probe:
+                self._probing = False
+
+    def _on_success(self):
+        if self.opened_at is not None:
+            log.info("%s circuit closed", self.name)
+        self.failures, self.opened_at = 0, None
+
+    def _on_failure(self):
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.fail_max:
+            if self.opened_at is None:
+                log.warning("%s circuit opened after %d failures", self.name, self.failures)
+            self.opened_at = time.monotonic()
+
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await self.call(fn, *args, **kwargs)
+        return wrapper
@@ -7,7 +7,7 @@ from typing import List
 
 log = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     mint: str
     symbol: str | None = None
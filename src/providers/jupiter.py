@@ -1,29 +1,75 @@
-import httpx
+import asyncio
+import orjson
+from cachetools import TTLCache
 from src.config import settings
+from src.providers._http import CLIENT, CircuitBreaker, raise_for_transient, retry_transient
 
 SOL_MINT = "So11111111111111111111111111111111111111112"
 
-async def quote(input_mint: str, output_mint: str, amount: int, slippage_bps: int) -> dict | None:
+# Upper bound on token base units a lamport buys for a pump.fun token: curves start at
+# 1.073B tokens (6 dp) against 30 SOL of virtual reserves and the price only rises
+# from there. Sizing the speculative sell with it never undershoots the real buy.
+PUMP_LAUNCH_RATE = 1_073_000_000 * 10**6 / (30 * 10**9)
+# successful quotes keyed on (input, output, amount, slippage)
+_QUOTE_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=settings.QUOTE_CACHE_TTL)
+# shared by quote() and the executor's /v6/swap call
+BREAKER = CircuitBreaker("jupiter")
+
+async def quote(input_mint: str, output_mint: str, amount: int, slippage_bps: int, *, use_cache: bool = True) -> dict | None:
+    """Jupiter quote. Pass use_cache=False when the quote will back a real swap."""
+    key = (input_mint, output_mint, amount, slippage_bps)
+    if use_cache:
+        hit = _QUOTE_CACHE.get(key)
+        if hit is not None:
+            return hit
     params = {
         "inputMint": input_mint,
         "outputMint": output_mint,
         "amount": amount,
         "slippageBps": slippage_bps,
     }
-    async with httpx.AsyncClient(timeout=10) as s:
-        r = await s.get(f"{settings.JUPITER_BASE}/v6/quote", params=params)
-        return r.json() if r.status_code == 200 else None
+    data = await _get_quote(params)
+    if data is not None:
+        _QUOTE_CACHE[key] = data
+    return data
+
+@BREAKER
+@retry_transient
+async def _get_quote(params: dict) -> dict | None:
+    r = await CLIENT.get(f"{settings.JUPITER_BASE}/v6/quote", params=params)
+    raise_for_transient(r)
+    return orjson.loads(r.content) if r.status_code == 200 else None
+
+def invalidate_quotes(mint: str):
+    """Drop cached quotes touching `mint` (e.g. after we've traded and moved the pool)."""
+    for key in [k for k in _QUOTE_CACHE if mint in (k[0], k[1])]:
+        _QUOTE_CACHE.pop(key, None)
 
 async def simulate_buy_sell(token_mint: str, lamports_in: int, slippage_bps: int) -> bool:
+    # The exact sell size is the buy's outAmount, which we only know afterwards. To
+    # avoid waiting on it, fire a sell sized at the launch-price upper bound alongside
+    # the buy: if at least that many tokens can be sold, so can the real amount.
+    # Anything else (smaller than the real buy, no route, error) is re-verified exactly.
+    spec_amount = int(lamports_in * PUMP_LAUNCH_RATE)
+    q_buy, q_sell = await asyncio.gather(
+        quote(SOL_MINT, token_mint, lamports_in, slippage_bps),
+        quote(token_mint, SOL_MINT, spec_amount, slippage_bps),
+        return_exceptions=True,
+    )
+    if isinstance(q_buy, BaseException):
+        raise q_buy
+    if isinstance(q_sell, BaseException):
+        q_sell = None  # speculative only; the exact sell below decides
+
     # BUY: SOL -> TOKEN
-    q_buy = await quote(SOL_MINT, token_mint, lamports_in, slippage_bps)
     if not q_buy or int(q_buy.get("outAmount", 0)) <= 0:
         return False
+    token_amount = int(q_buy["outAmount"])
+
     # SELL: TOKEN -> SOL (use buy outAmount as input for the sell path)
-    token_amount = int(q_buy["outAmount"]) if "outAmount" in q_buy else 0
-    if token_amount <= 0:
-        return False
-    q_sell = await quote(token_mint, SOL_MINT, token_amount, slippage_bps)
+    spec_ok = q_sell and int(q_sell.get("outAmount", 0)) > 0 and spec_amount >= token_amount
+    if not spec_ok:
+        q_sell = await quote(token_mint, SOL_MINT, token_amount, slippage_bps)
     if not q_sell or int(q_sell.get("outAmount", 0)) <= 0:
         return False
     return True
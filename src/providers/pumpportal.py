@@ -1,11 +1,16 @@
-import os, logging, httpx
+import asyncio, logging
 from dataclasses import dataclass
 from typing import List
+import orjson, websockets
 from src.config import settings
+from src.providers._http import CLIENT
 
 log = logging.getLogger(__name__)
 
-@dataclass
+# filled by stream_candidates(), drained by engine.collect_candidates()
+QUEUE: "asyncio.Queue[Candidate]" = asyncio.Queue(maxsize=1000)
+
+@dataclass(slots=True)
 class Candidate:
     mint: str
     symbol: str | None = None
@@ -22,25 +27,69 @@ async def fetch_candidates() -> List[Candidate]:
 
     url = f"{base.rstrip('/')}/tokens/recent"
     try:
-        async with httpx.AsyncClient(timeout=10) as s:
-            r = await s.get(url)
-            if r.status_code != 200:
-                log.warning("PumpPortal %s -> %s", url, r.status_code)
-                return []
-            data = r.json()
-            cands: List[Candidate] = []
-            for item in data[:10]:  # limit per cycle
-                mint = item.get("mint") or item.get("address")
-                if not mint:
-                    continue
-                cands.append(Candidate(
-                    mint=mint,
-                    symbol=item.get("symbol"),
-                    name=item.get("name"),
-                    created_ts=item.get("created_at") or item.get("ts"),
-                    graduated=bool(item.get("graduated") or False),
-                ))
-            return cands
+        r = await CLIENT.get(url)
+        if r.status_code != 200:
+            log.warning("PumpPortal %s -> %s", url, r.status_code)
+            return []
+        data = orjson.loads(r.content)
+        cands: List[Candidate] = []
+        for item in data[:10]:  # limit per cycle
+            mint = item.get("mint") or item.get("address")
+            if not mint:
+                continue
+            cands.append(Candidate(
+                mint=mint,
+                symbol=item.get("symbol"),
+                name=item.get("name"),
+                created_ts=item.get("created_at") or item.get("ts"),
+                graduated=bool(item.get("graduated") or False),
+            ))
+        return cands
     except Exception as e:
         log.exception("PumpPortal polling failed: %s", e)
         return []
+
+def _parse_event(raw) -> Candidate | None:
+    """One stream frame -> Candidate, or None for acks and malformed frames."""
+    try:
+        item = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        log.debug("PumpPortal: skipping non-JSON frame %.80r", raw)
+        return None
+    if not isinstance(item, dict):
+        return None
+    mint = item.get("mint")
+    if not mint or not isinstance(mint, str):
+        return None  # subscription acks etc.
+    return Candidate(
+        mint=mint,
+        symbol=item.get("symbol"),
+        name=item.get("name"),
+        created_ts=item.get("timestamp"),
+    )
+
+async def stream_candidates(queue: "asyncio.Queue[Candidate]" = QUEUE):
+    """Subscribe to PumpPortal new-token events and push Candidates onto `queue`.
+    Runs until cancelled, reconnecting with backoff on connection errors; bad
+    frames are skipped without dropping the connection.
+    """
+    url = settings.PUMPPORTAL_WS_URL
+    backoff = 1.0
+    while True:
+        try:
+            async with websockets.connect(url) as ws:
+                await ws.send(orjson.dumps({"method": "subscribeNewToken"}).decode())
+                log.info("PumpPortal stream connected: %s", url)
+                backoff = 1.0
+                async for raw in ws:
+                    cand = _parse_event(raw)
+                    if cand is None:
+                        continue
+                    try:
+                        queue.put_nowait(cand)
+                    except asyncio.QueueFull:
+                        log.warning("PumpPortal queue full; dropping %s", cand.mint)
+        except (OSError, TimeoutError, websockets.WebSocketException) as e:
+            log.warning("PumpPortal stream error: %s; reconnecting in %.0fs", e, backoff)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
@@ -1,20 +1,79 @@
-import httpx, logging
-from typing import Sequence
+import asyncio, logging
+from typing import Dict, Optional, Sequence
+import orjson
+from cachetools import TTLCache
 from src.config import settings
+from src.providers._http import CLIENT, JSON_HEADERS, CircuitBreaker, retry_transient
 
 log = logging.getLogger(__name__)
 
+# per-mint summaries; candidate lists overlap heavily between polls
+_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=settings.RUGCHECK_CACHE_TTL)
+_BREAKER = CircuitBreaker("rugcheck")
+
 async def bulk_summary(mints: Sequence[str]) -> dict:
     if not settings.RUGCHECK_API_KEY:
         log.warning("RugCheck API key not set; treating all as high risk.")
         return {m: {"risk_level": "high", "flags": ["no_api_key"]} for m in mints}
-    headers = {"Authorization": f"Bearer {settings.RUGCHECK_API_KEY}"}
-    async with httpx.AsyncClient(timeout=10) as s:
-        r = await s.post(
-            f"{settings.RUGCHECK_API_BASE}/v1/bulk/tokens/summary",
-            headers=headers,
-            json={"mints": list(mints)},
-        )
-        r.raise_for_status()
-        data = r.json()
-        return data
+    out = {}
+    for m in mints:
+        hit = _CACHE.get(m)
+        if hit is not None:
+            out[m] = hit
+    missing = [m for m in mints if m not in out]
+    if not missing:
+        return out
+    data = await _post_bulk(missing)
+    for m in missing:
+        if m in data:
+            _CACHE[m] = data[m]
+    out.update(data)
+    return out
+
+@_BREAKER
+@retry_transient
+async def _post_bulk(mints: list) -> dict:
+    headers = {**JSON_HEADERS, "Authorization": f"Bearer {settings.RUGCHECK_API_KEY}"}
+    r = await CLIENT.post(
+        f"{settings.RUGCHECK_API_BASE}/v1/bulk/tokens/summary",
+        headers=headers,
+        content=orjson.dumps({"mints": mints}),
+    )
+    r.raise_for_status()
+    return orjson.loads(r.content)
+
+class RugcheckBatcher:
+    """Coalesces summary lookups from concurrent callers into one bulk POST.
+    Mints requested within `window` seconds of the first pending one share a request.
+    """
+
+    def __init__(self, window: float = 0.05):
+        self.window = window
+        self.pending: Dict[str, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def get(self, mint: str) -> Optional[dict]:
+        fut = self.pending.get(mint)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            self.pending[mint] = fut
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush())
+        # shield: one caller being cancelled must not cancel the shared future
+        return await asyncio.shield(fut)
+
+    async def _flush(self):
+        await asyncio.sleep(self.window)
+        batch, self.pending, self._flush_task = self.pending, {}, None
+        try:
+            data = await bulk_summary(list(batch))
+        except Exception as e:
+            for fut in batch.values():
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for mint, fut in batch.items():
+            if not fut.done():
+                fut.set_result(data.get(mint))
+
+batcher = RugcheckBatcher()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-@dataclass
+_OK_RISK = frozenset({"low", "medium"})
+_BAD_FLAGS = frozenset({"honeypot", "blacklist", "trading_disabled"})
+
+@dataclass(slots=True)
 class TokenInfo:
     mint_revoked: bool
     freeze_revoked: bool
@@ -11,17 +14,16 @@ class TokenInfo:
     pool_ok: bool
 
 def hard_filters_pass(info: TokenInfo, rc_summary: dict, *, max_top5: float, min_liq: float) -> bool:
+    # most tokens are rated high risk, so this rejects the bulk of candidates first
+    risk = rc_summary.get("risk_level", "high")
+    if risk not in _OK_RISK:
+        return False
     if not (info.mint_revoked and info.freeze_revoked):
         return False
     if info.top5_pct > max_top5:
         return False
     if info.liquidity_sol < min_liq:
         return False
-    risk = rc_summary.get("risk_level", "high")
-    if risk not in ("low", "medium"):
-        return False
-    flags = set(map(str.lower, rc_summary.get("flags", [])))
-    bad = {"honeypot", "blacklist", "trading_disabled"}
-    if flags & bad:
+    if any(f.lower() in _BAD_FLAGS for f in rc_summary.get("flags", ())):
         return False
     return True
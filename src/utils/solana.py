@@ -1,20 +1,27 @@
-import base58, base64, json
+import asyncio, base64, functools, json
+import orjson
+import based58 as base58  # Rust-backed; unlike the base58 package, b58decode accepts bytes only
 from typing import Any, Dict
 from solders.keypair import Keypair
 from src.config import settings
-import httpx
+from src.providers._http import CLIENT, JSON_HEADERS, CircuitBreaker, retry_transient_within
 
 def load_keypair(pk_str: str) -> Keypair:
     """Accept base58 string or JSON array (as string) exported by Solana CLI."""
     try:
         # base58 private key (64/32 bytes)
-        secret = base58.b58decode(pk_str)
+        secret = base58.b58decode(pk_str.encode())  # based58 rejects str
         return Keypair.from_seed(secret[:32])
     except Exception:
         # try JSON array
         arr = json.loads(pk_str)
         return Keypair.from_bytes(bytes(arr))
 
+@functools.lru_cache(maxsize=1)
+def get_keypair() -> Keypair:
+    """The configured wallet keypair, decoded once per process."""
+    return load_keypair(settings.WALLET_PRIVATE_KEY)
+
 async def rpc_send_raw_tx(b64_tx: str) -> Dict[str, Any]:
     payload = {
         "jsonrpc": "2.0",
@@ -22,10 +29,52 @@ async def rpc_send_raw_tx(b64_tx: str) -> Dict[str, Any]:
         "method": "sendTransaction",
         "params": [
             b64_tx,
-            {"skipPreflight": False, "preflightCommitment": "confirmed"},
+            # engine only sends live buys whose simulate_buy_sell passed; skip the RPC-side
+            # simulation and rebroadcasts so the tx hits the leader as fast as possible
+            {"skipPreflight": True, "preflightCommitment": "processed", "maxRetries": 0, "encoding": "base64"},
         ],
     }
-    async with httpx.AsyncClient(timeout=20) as s:
-        r = await s.post(settings.SOLANA_RPC_URL, json=payload)
-        r.raise_for_status()
-        return r.json()
+    urls = list(dict.fromkeys([settings.SOLANA_RPC_URL, *settings.SOLANA_RPC_URLS]))
+    if len(urls) == 1:
+        return await _rpc_post(urls[0], payload)
+
+    # broadcast to every endpoint; first RPC to accept the tx wins, the rest are cancelled
+    pending = {asyncio.create_task(_rpc_post(u, payload)) for u in urls}
+    first_error: Dict[str, Any] | None = None
+    last_exc: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                if t.exception() is not None:
+                    last_exc = t.exception()
+                    continue
+                res = t.result()
+                if "result" in res:
+                    return res
+                first_error = first_error or res
+    finally:
+        for t in pending:
+            t.cancel()
+    if first_error is not None:
+        return first_error
+    raise last_exc
+
+# a stalled RPC must not hold a live buy until its blockhash expires
+SEND_ATTEMPT_TIMEOUT = 5.0
+SEND_DEADLINE = 8.0
+
+# one breaker per endpoint so a single degraded RPC doesn't block the others
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+async def _rpc_post(url: str, payload: dict) -> Dict[str, Any]:
+    breaker = _BREAKERS.get(url)
+    if breaker is None:
+        breaker = _BREAKERS[url] = CircuitBreaker(f"rpc {url}")
+    return await breaker.call(_rpc_post_once, url, payload)
+
+@retry_transient_within(SEND_DEADLINE)
+async def _rpc_post_once(url: str, payload: dict) -> Dict[str, Any]:
+    r = await CLIENT.post(url, content=orjson.dumps(payload), headers=JSON_HEADERS, timeout=SEND_ATTEMPT_TIMEOUT)
+    r.raise_for_status()
+    return orjson.loads(r.content)
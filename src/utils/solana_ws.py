@@ -0,0 +1,135 @@
+"""Solana PubSub over a single persistent WebSocket.
+Used to wait for transaction confirmation via signatureSubscribe instead of
+polling getSignatureStatuses.
+"""
+import asyncio, itertools, logging
+import orjson
+from typing import Any, Dict, Optional
+import websockets
+from src.config import settings
+
+log = logging.getLogger(__name__)
+
+_ws = None
+_reader: Optional[asyncio.Task] = None
+_connect_lock: Optional[asyncio.Lock] = None
+_ids = itertools.count(1)
+# request id -> (ack future resolving to subscription id, notification future)
+_pending: Dict[int, tuple] = {}
+# subscription id -> notification future
+_subs: Dict[int, asyncio.Future] = {}
+
+def _ws_url() -> str:
+    if settings.SOLANA_WS_URL:
+        return settings.SOLANA_WS_URL
+    # derive from the HTTP endpoint: https://host -> wss://host
+    return settings.SOLANA_RPC_URL.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+
+async def _connect():
+    global _ws, _reader, _connect_lock
+    if _connect_lock is None:
+        _connect_lock = asyncio.Lock()
+    async with _connect_lock:
+        if _ws is None:
+            _ws = await websockets.connect(_ws_url())
+            _reader = asyncio.create_task(_read_loop(_ws))
+    return _ws
+
+async def _read_loop(ws):
+    global _ws
+    try:
+        async for raw in ws:
+            msg = orjson.loads(raw)
+            if "id" in msg:
+                entry = _pending.pop(msg["id"], None)
+                if entry is None:
+                    continue  # e.g. unsubscribe ack
+                ack, note = entry
+                if ack.done():
+                    # caller gave up before the ack arrived; don't leave the subscription behind
+                    if "result" in msg:
+                        await _unsubscribe(ws, msg["result"])
+                    continue
+                if "error" in msg:
+                    ack.set_exception(RuntimeError(f"signatureSubscribe error: {msg['error']}"))
+                    continue
+                # register before resolving so a notification right behind the ack isn't dropped
+                _subs[msg["result"]] = note
+                ack.set_result(msg["result"])
+            elif msg.get("method") == "signatureNotification":
+                params = msg.get("params", {})
+                note = _subs.pop(params.get("subscription"), None)
+                if note is not None and not note.done():
+                    note.set_result(params.get("result", {}).get("value"))
+    except Exception as e:
+        log.warning("Solana WS reader stopped: %s", e)
+    finally:
+        _ws = None
+        err = ConnectionError("Solana WS connection closed")
+        for ack, note in _pending.values():
+            if not ack.done():
+                ack.set_exception(err)
+            note.cancel()  # never awaited without an ack
+        for note in _subs.values():
+            if not note.done():
+                note.set_exception(err)
+        _pending.clear()
+        _subs.clear()
+
+async def wait_for_signature(sig: str, commitment: str = "confirmed", timeout: float = 30) -> Optional[Dict[str, Any]]:
+    """Wait until `sig` reaches `commitment`. Returns the notification value
+    (`{"err": ...}`), or None if we couldn't tell within `timeout` seconds --
+    either it hasn't landed yet or the PubSub connection failed. Never raises
+    for those cases: the tx is already out, so confirmation is best effort.
+    """
+    loop = asyncio.get_running_loop()
+    req_id = next(_ids)
+    ack, note = loop.create_future(), loop.create_future()
+    sub_id = None
+    ws = None
+    try:
+        # one deadline for connect + subscribe ack + notification
+        async with asyncio.timeout(timeout):
+            ws = await _connect()
+            _pending[req_id] = (ack, note)
+            # .decode(): orjson gives bytes, which websockets would send as a binary frame
+            await ws.send(orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": req_id,
+                "method": "signatureSubscribe",
+                "params": [sig, {"commitment": commitment}],
+            }).decode())
+            sub_id = await ack
+            return await note
+    except TimeoutError:
+        return None
+    except (OSError, websockets.WebSocketException, RuntimeError) as e:
+        log.warning("Solana WS confirmation for %s unavailable: %s", sig, e)
+        return None
+    finally:
+        if not ack.done():
+            # no ack yet; leave the entry so the reader can unsubscribe if it still arrives
+            ack.cancel()
+            note.cancel()
+        elif sub_id is not None and _subs.pop(sub_id, None) is not None and _ws is ws:
+            # subscribed but no notification (the server drops the sub itself after notifying)
+            await _unsubscribe(ws, sub_id)
+
+async def _unsubscribe(ws, sub_id: int):
+    try:
+        await ws.send(orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": next(_ids),
+            "method": "signatureUnsubscribe",
+            "params": [sub_id],
+        }).decode())
+    except websockets.WebSocketException as e:
+        log.debug("signatureUnsubscribe %s failed: %s", sub_id, e)
+
+async def close():
+    global _ws
+    if _reader is not None:
+        _reader.cancel()
+    if _ws is not None:
+        await _ws.close()
+        _ws = None
@@ -0,0 +1,9 @@
+import os, sys
+
+# src.config builds Settings at import time; give it the required fields
+os.environ.setdefault("SOLANA_RPC_URL", "http://127.0.0.1:8899")
+os.environ.setdefault("WALLET_PUBLIC_KEY", "11111111111111111111111111111111")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# smoke_test.py is a standalone script run directly by CI, not a pytest module
+collect_ignore = ["smoke_test.py"]
@@ -0,0 +1,67 @@
+import asyncio
+from collections import OrderedDict
+import pytest
+from src import engine
+from src.config import settings
+from src.providers.pumpportal import Candidate
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(engine, "SEEN", OrderedDict())
+    monkeypatch.setattr(engine, "_IN_FLIGHT", set())
+    monkeypatch.setattr(engine, "_SEM", asyncio.Semaphore(4))
+
+def _mints(cands):
+    return [c.mint for c in cands]
+
+def test_fresh_drops_duplicates_keeping_order():
+    cands = [Candidate("a"), Candidate("b"), Candidate("a"), Candidate("c")]
+    assert _mints(engine._fresh(cands)) == ["a", "b", "c"]
+
+def test_fresh_skips_in_flight_until_released():
+    assert _mints(engine._fresh([Candidate("a")])) == ["a"]
+    assert engine._fresh([Candidate("a")]) == []
+    engine._IN_FLIGHT.discard("a")
+    assert _mints(engine._fresh([Candidate("a")])) == ["a"]
+
+def test_fresh_skips_seen_within_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(engine.time, "monotonic", lambda: now[0])
+    engine._mark_seen("a")
+    assert engine._fresh([Candidate("a")]) == []
+    now[0] += settings.SEEN_TTL + 1
+    assert _mints(engine._fresh([Candidate("a")])) == ["a"]
+
+def test_mark_seen_evicts_oldest(monkeypatch):
+    monkeypatch.setattr(engine, "SEEN_MAX", 2)
+    for m in ("a", "b", "c"):
+        engine._mark_seen(m)
+    assert list(engine.SEEN) == ["b", "c"]
+
+def _fake_rugcheck(monkeypatch, fail=False):
+    async def get(mint):
+        if fail:
+            raise RuntimeError("rugcheck down")
+        return {"risk_level": "low"}
+    monkeypatch.setattr(engine.rugcheck.batcher, "get", get)
+
+def test_only_successfully_handled_mints_are_marked_seen(monkeypatch):
+    _fake_rugcheck(monkeypatch)
+
+    async def handle(c, rc_bulk, sem, *, paper):
+        if c.mint == "bad":
+            raise RuntimeError("quote 503")
+
+    monkeypatch.setattr(engine, "_handle", handle)
+    asyncio.run(engine.process_candidates([Candidate("ok"), Candidate("bad")]))
+    assert list(engine.SEEN) == ["ok"]
+    assert engine._IN_FLIGHT == set()
+    # the failed mint is picked up again on the next batch
+    assert _mints(engine._fresh([Candidate("ok"), Candidate("bad")])) == ["bad"]
+
+def test_rugcheck_failure_marks_nothing_and_releases_in_flight(monkeypatch):
+    _fake_rugcheck(monkeypatch, fail=True)
+    with pytest.raises(RuntimeError):
+        asyncio.run(engine.process_candidates([Candidate("a"), Candidate("b")]))
+    assert not engine.SEEN
+    assert engine._IN_FLIGHT == set()
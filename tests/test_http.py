@@ -0,0 +1,157 @@
+import asyncio
+import httpx
+import pytest
+from src.providers import _http
+from src.providers._http import CircuitBreaker, CircuitOpenError, is_transient
+
+def _status_error(code: int) -> httpx.HTTPStatusError:
+    req = httpx.Request("GET", "https://example.invalid")
+    return httpx.HTTPStatusError("boom", request=req, response=httpx.Response(code, request=req))
+
+@pytest.mark.parametrize("code, expected", [(429, True), (500, True), (503, True), (400, False), (401, False), (404, False)])
+def test_is_transient_status(code, expected):
+    assert is_transient(_status_error(code)) is expected
+
+def test_is_transient_other():
+    assert is_transient(httpx.ConnectError("down"))
+    assert not is_transient(ValueError("bad payload"))
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(_http.time, "monotonic", c.monotonic)
+    return c
+
+async def _fail():
+    raise httpx.ConnectError("down")
+
+async def _ok():
+    return "ok"
+
+def _run(breaker, fn):
+    return asyncio.run(breaker.call(fn))
+
+def _trip(breaker):
+    for _ in range(breaker.fail_max):
+        with pytest.raises(httpx.ConnectError):
+            _run(breaker, _fail)
+
+def test_opens_after_fail_max_and_fails_fast(clock):
+    b = CircuitBreaker("t", fail_max=3, reset_timeout=30)
+    _trip(b)
+    calls = []
+
+    async def tracked():
+        calls.append(1)
+
+    with pytest.raises(CircuitOpenError):
+        _run(b, tracked)
+    assert calls == []
+
+def test_success_resets_failure_count(clock):
+    b = CircuitBreaker("t", fail_max=3)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            _run(b, _fail)
+    assert _run(b, _ok) == "ok"
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            _run(b, _fail)
+    assert _run(b, _ok) == "ok"  # never reached fail_max in a row
+
+def test_non_transient_error_does_not_count(clock):
+    b = CircuitBreaker("t", fail_max=2)
+
+    async def bad_request():
+        raise _status_error(400)
+
+    for _ in range(5):
+        with pytest.raises(httpx.HTTPStatusError):
+            _run(b, bad_request)
+    assert _run(b, _ok) == "ok"
+
+def test_probe_success_closes(clock):
+    b = CircuitBreaker("t", fail_max=2, reset_timeout=30)
+    _trip(b)
+    clock.now += 31
+    assert _run(b, _ok) == "ok"
+    # closed again: a single new failure doesn't re-open it
+    with pytest.raises(httpx.ConnectError):
+        _run(b, _fail)
+    assert _run(b, _ok) == "ok"
+
+def test_probe_failure_reopens(clock):
+    b = CircuitBreaker("t", fail_max=2, reset_timeout=30)
+    _trip(b)
+    clock.now += 31
+    with pytest.raises(httpx.ConnectError):
+        _run(b, _fail)
+    with pytest.raises(CircuitOpenError):
+        _run(b, _ok)
+    clock.now += 31
+    assert _run(b, _ok) == "ok"
+
+def test_half_open_lets_only_one_probe_through(clock):
+    b = CircuitBreaker("t", fail_max=2, reset_timeout=30)
+    _trip(b)
+    clock.now += 31
+
+    async def main():
+        release = asyncio.Event()
+
+        async def slow_ok():
+            await release.wait()
+            return "ok"
+
+        probe = asyncio.create_task(b.call(slow_ok))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await b.call(_ok)
+        release.set()
+        assert await probe == "ok"
+        assert await b.call(_ok) == "ok"
+
+    asyncio.run(main())
+
+def test_timeout_is_transient():
+    assert is_transient(TimeoutError())
+
+def test_retry_within_caps_total_time_across_attempts():
+    attempts = []
+
+    @_http.retry_transient_within(0.2)
+    async def hangs():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("down")
+        await asyncio.sleep(10)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        with pytest.raises(TimeoutError):
+            await hangs()
+        return loop.time() - start
+
+    assert asyncio.run(main()) < 0.5
+    assert len(attempts) == 2
+
+def test_retry_within_still_retries_transient_errors():
+    attempts = []
+
+    @_http.retry_transient_within(5)
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _status_error(503)
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert len(attempts) == 3
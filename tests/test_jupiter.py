@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from src.providers import jupiter
+from src.providers.jupiter import SOL_MINT, PUMP_LAUNCH_RATE, simulate_buy_sell
+
+LAMPORTS = 30_000_000
+SPEC = int(LAMPORTS * PUMP_LAUNCH_RATE)
+
+def _fake_quotes(monkeypatch, buy_out, sell):
+    """`sell(amount)` returns a quote dict / None or raises; records every sell amount."""
+    sells = []
+
+    async def fake_quote(input_mint, output_mint, amount, slippage_bps, **kw):
+        if input_mint == SOL_MINT:
+            return {"outAmount": str(buy_out)} if buy_out is not None else None
+        sells.append(amount)
+        return sell(amount)
+
+    monkeypatch.setattr(jupiter, "quote", fake_quote)
+    return sells
+
+def _run():
+    return asyncio.run(simulate_buy_sell("MINT", LAMPORTS, 50))
+
+def test_speculative_sell_accepted_without_reissue(monkeypatch):
+    sells = _fake_quotes(monkeypatch, SPEC // 10, lambda a: {"outAmount": "1"})
+    assert _run() is True
+    assert sells == [SPEC]
+
+def test_speculative_sell_below_real_amount_is_reissued(monkeypatch):
+    sells = _fake_quotes(monkeypatch, SPEC * 2, lambda a: {"outAmount": "1"})
+    assert _run() is True
+    assert sells == [SPEC, SPEC * 2]
+
+@pytest.mark.parametrize("spec_result", ["raise", "zero", "none"])
+def test_failed_speculative_sell_falls_back_to_exact(monkeypatch, spec_result):
+    exact = SPEC // 10
+
+    def sell(amount):
+        if amount == SPEC:
+            if spec_result == "raise":
+                raise RuntimeError("429")
+            return {"outAmount": "0"} if spec_result == "zero" else None
+        return {"outAmount": "5"}
+
+    sells = _fake_quotes(monkeypatch, exact, sell)
+    assert _run() is True
+    assert sells == [SPEC, exact]
+
+def test_exact_sell_failure_rejects(monkeypatch):
+    sells = _fake_quotes(monkeypatch, SPEC // 10, lambda a: None)
+    assert _run() is False
+    assert sells == [SPEC, SPEC // 10]
+
+def test_failed_buy_rejects_without_exact_sell(monkeypatch):
+    sells = _fake_quotes(monkeypatch, None, lambda a: {"outAmount": "1"})
+    assert _run() is False
+    assert sells == [SPEC]
+
+def test_buy_error_propagates(monkeypatch):
+    async def fake_quote(input_mint, output_mint, amount, slippage_bps, **kw):
+        if input_mint == SOL_MINT:
+            raise RuntimeError("jupiter down")
+        return {"outAmount": "1"}
+
+    monkeypatch.setattr(jupiter, "quote", fake_quote)
+    with pytest.raises(RuntimeError):
+        _run()
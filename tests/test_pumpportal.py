@@ -0,0 +1,45 @@
+import asyncio
+import orjson
+import pytest
+import websockets
+from src.config import settings
+from src.providers.pumpportal import _parse_event, stream_candidates
+
+@pytest.mark.parametrize("raw", [
+    "not json",
+    "[1, 2]",
+    '"mint"',
+    '{"message": "Successfully subscribed"}',
+    '{"mint": 123}',
+])
+def test_parse_event_skips_acks_and_malformed_frames(raw):
+    assert _parse_event(raw) is None
+
+def test_parse_event_builds_candidate():
+    c = _parse_event('{"mint": "M1", "symbol": "X", "name": "Ex", "timestamp": 1.5}')
+    assert (c.mint, c.symbol, c.name, c.created_ts) == ("M1", "X", "Ex", 1.5)
+
+def test_stream_survives_bad_frames(monkeypatch):
+    connections = []
+
+    async def handler(ws):
+        connections.append(ws)
+        await ws.recv()  # subscribeNewToken
+        for frame in ["{oops", "[]", orjson.dumps({"mint": "A"}).decode(), "null", orjson.dumps({"mint": "B"}).decode()]:
+            await ws.send(frame)
+        await asyncio.sleep(1)
+
+    async def main():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            monkeypatch.setattr(settings, "PUMPPORTAL_WS_URL", f"ws://127.0.0.1:{port}")
+            queue = asyncio.Queue()
+            task = asyncio.create_task(stream_candidates(queue))
+            try:
+                got = [await asyncio.wait_for(queue.get(), 1) for _ in range(2)]
+            finally:
+                task.cancel()
+            return [c.mint for c in got]
+
+    assert asyncio.run(main()) == ["A", "B"]
+    assert len(connections) == 1  # never reconnected
@@ -0,0 +1,52 @@
+import asyncio
+import pytest
+from src.providers import rugcheck
+from src.providers.rugcheck import RugcheckBatcher
+
+def test_concurrent_gets_share_one_bulk_call(monkeypatch):
+    calls = []
+
+    async def fake_bulk(mints):
+        calls.append(sorted(mints))
+        return {m: {"risk_level": "low"} for m in mints if m != "unknown"}
+
+    monkeypatch.setattr(rugcheck, "bulk_summary", fake_bulk)
+
+    async def main():
+        b = RugcheckBatcher(window=0.01)
+        return await asyncio.gather(b.get("a"), b.get("b"), b.get("a"), b.get("unknown"))
+
+    a1, b1, a2, unknown = asyncio.run(main())
+    assert calls == [["a", "b", "unknown"]]
+    assert a1 == a2 == b1 == {"risk_level": "low"}
+    assert unknown is None
+
+def test_separate_windows_make_separate_calls(monkeypatch):
+    calls = []
+
+    async def fake_bulk(mints):
+        calls.append(list(mints))
+        return {m: {} for m in mints}
+
+    monkeypatch.setattr(rugcheck, "bulk_summary", fake_bulk)
+
+    async def main():
+        b = RugcheckBatcher(window=0.01)
+        await b.get("a")
+        await b.get("b")
+
+    asyncio.run(main())
+    assert calls == [["a"], ["b"]]
+
+def test_bulk_error_reaches_every_waiter(monkeypatch):
+    async def fake_bulk(mints):
+        raise RuntimeError("rugcheck down")
+
+    monkeypatch.setattr(rugcheck, "bulk_summary", fake_bulk)
+
+    async def main():
+        b = RugcheckBatcher(window=0.01)
+        return await asyncio.gather(b.get("a"), b.get("b"), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
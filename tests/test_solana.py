@@ -0,0 +1,61 @@
+import asyncio
+import httpx
+import pytest
+from src.config import settings
+from src.utils import solana
+
+def _endpoints(monkeypatch, primary, extra, behaviour):
+    """behaviour[url] = (delay, result dict | exception). Returns (calls, cancelled)."""
+    monkeypatch.setattr(settings, "SOLANA_RPC_URL", primary)
+    monkeypatch.setattr(settings, "SOLANA_RPC_URLS", extra)
+    calls, cancelled = [], []
+
+    async def fake_post(url, payload):
+        calls.append(url)
+        delay, outcome = behaviour[url]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(solana, "_rpc_post", fake_post)
+    return calls, cancelled
+
+def _send():
+    return asyncio.run(solana.rpc_send_raw_tx("dHg="))
+
+def test_first_success_wins_and_losers_are_cancelled(monkeypatch):
+    calls, cancelled = _endpoints(monkeypatch, "http://a", ["http://b", "http://c"], {
+        "http://a": (0.5, {"result": "sigA"}),
+        "http://b": (0.0, {"error": {"code": -32002}}),
+        "http://c": (0.05, {"result": "sigC"}),
+    })
+    assert _send() == {"result": "sigC"}
+    assert sorted(calls) == ["http://a", "http://b", "http://c"]
+    assert cancelled == ["http://a"]
+
+def test_rpc_error_returned_only_when_nobody_succeeds(monkeypatch):
+    _endpoints(monkeypatch, "http://a", ["http://b"], {
+        "http://a": (0.0, {"error": {"code": -32002, "message": "blockhash not found"}}),
+        "http://b": (0.05, httpx.ConnectError("down")),
+    })
+    assert _send() == {"error": {"code": -32002, "message": "blockhash not found"}}
+
+def test_transport_error_reraised_when_all_fail(monkeypatch):
+    _endpoints(monkeypatch, "http://a", ["http://b"], {
+        "http://a": (0.0, httpx.ConnectError("a down")),
+        "http://b": (0.01, httpx.ReadTimeout("b slow")),
+    })
+    with pytest.raises(httpx.TransportError):
+        _send()
+
+def test_duplicate_urls_collapse_to_one_call(monkeypatch):
+    calls, _ = _endpoints(monkeypatch, "http://a", ["http://a", "http://a"], {
+        "http://a": (0.0, {"result": "sig"}),
+    })
+    assert _send() == {"result": "sig"}
+    assert calls == ["http://a"]
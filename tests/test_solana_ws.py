@@ -0,0 +1,82 @@
+import asyncio
+import orjson
+import pytest
+import websockets
+from src.config import settings
+from src.utils import solana_ws
+
+@pytest.fixture(autouse=True)
+def reset_ws_state(monkeypatch):
+    # module-level connection state must not leak between event loops
+    monkeypatch.setattr(solana_ws, "_ws", None)
+    monkeypatch.setattr(solana_ws, "_reader", None)
+    monkeypatch.setattr(solana_ws, "_connect_lock", None)
+    monkeypatch.setattr(solana_ws, "_pending", {})
+    monkeypatch.setattr(solana_ws, "_subs", {})
+
+def _with_server(monkeypatch, behaviour, body):
+    """Run `body()` against a local PubSub server; `behaviour[sig]` picks the reply."""
+    received = []
+
+    async def handler(ws):
+        async for raw in ws:
+            msg = orjson.loads(raw)
+            received.append(msg["method"])
+            if msg["method"] != "signatureSubscribe":
+                continue
+            mode = behaviour[msg["params"][0]]
+            if mode == "late_ack":
+                await asyncio.sleep(0.3)
+            await ws.send(orjson.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": 42}).decode())
+            if mode in ("ok", "err"):
+                value = {"err": None} if mode == "ok" else {"err": {"InstructionError": [0, "Custom"]}}
+                await ws.send(orjson.dumps({
+                    "jsonrpc": "2.0",
+                    "method": "signatureNotification",
+                    "params": {"subscription": 42, "result": {"value": value}},
+                }).decode())
+
+    async def main():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            monkeypatch.setattr(settings, "SOLANA_WS_URL", f"ws://127.0.0.1:{port}")
+            try:
+                result = await body()
+                await asyncio.sleep(0.4)  # let late acks / unsubscribes land
+                return result
+            finally:
+                await solana_ws.close()
+
+    return asyncio.run(main()), received
+
+def test_confirmed(monkeypatch):
+    res, _ = _with_server(monkeypatch, {"sig": "ok"}, lambda: solana_ws.wait_for_signature("sig", timeout=2))
+    assert res == {"err": None}
+
+def test_err_is_returned(monkeypatch):
+    res, _ = _with_server(monkeypatch, {"sig": "err"}, lambda: solana_ws.wait_for_signature("sig", timeout=2))
+    assert res["err"] == {"InstructionError": [0, "Custom"]}
+
+def test_no_notification_times_out_and_unsubscribes(monkeypatch):
+    res, received = _with_server(monkeypatch, {"sig": "silent"}, lambda: solana_ws.wait_for_signature("sig", timeout=0.2))
+    assert res is None
+    assert received == ["signatureSubscribe", "signatureUnsubscribe"]
+
+def test_late_ack_is_unsubscribed(monkeypatch):
+    res, received = _with_server(monkeypatch, {"sig": "late_ack"}, lambda: solana_ws.wait_for_signature("sig", timeout=0.1))
+    assert res is None
+    assert received == ["signatureSubscribe", "signatureUnsubscribe"]
+
+def test_timeout_is_one_deadline(monkeypatch):
+    async def body():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await solana_ws.wait_for_signature("sig", timeout=0.2)
+        return loop.time() - start
+
+    elapsed, _ = _with_server(monkeypatch, {"sig": "late_ack"}, body)
+    assert elapsed < 0.3
+
+def test_connect_failure_returns_none(monkeypatch):
+    monkeypatch.setattr(settings, "SOLANA_WS_URL", "ws://127.0.0.1:1")
+    assert asyncio.run(solana_ws.wait_for_signature("sig", timeout=2)) is None